@@ -25,15 +25,346 @@ Usage:
 
 """
 
-import yfinance as yf
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+import os
+import glob
+import importlib.util
+from datetime import datetime, timedelta, timezone
 import warnings
+import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor
 warnings.filterwarnings('ignore')
 
+# numba is optional and slow to import, so only check it is installed; it is
+# imported when the screening kernel is first compiled (see _get_screen_kernel)
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+try:
+    import bottleneck as bn
+    nanmax, nanmin = bn.nanmax, bn.nanmin
+except ImportError:
+    nanmax, nanmin = np.nanmax, np.nanmin
+
+# yfinance is slow to import, so it is loaded on first use via _yf()
+yf = None
+
+def _yf():
+    """
+    Import yfinance on first use and return the module
+    """
+    global yf
+    if yf is None:
+        import yfinance
+        yf = yfinance
+    return yf
+
+# Screening windows shared by the per-symbol, NumPy and Numba implementations
+MONTH_DAYS = 22        # Trading days in the monthly candle
+WEEK_DAYS = 5          # Trading days in a weekly candle
+MIN_HISTORY_DAYS = 50  # Minimum days of history needed to screen a stock
+
+IST = timezone(timedelta(hours=5, minutes=30))
+MARKET_OPEN = (9, 15)
+MARKET_CLOSE = (15, 30)
+
+# NIFTY 50 - Top 50 large-cap stocks
+_NIFTY_50 = (
+    'RELIANCE.NS', 'TCS.NS', 'INFY.NS', 'HDFCBANK.NS', 'ICICIBANK.NS',
+    'HINDUNILVR.NS', 'SBIN.NS', 'BHARTIARTL.NS', 'ITC.NS', 'KOTAKBANK.NS',
+    'LT.NS', 'ASIANPAINT.NS', 'MARUTI.NS', 'HCLTECH.NS', 'WIPRO.NS',
+    'TITAN.NS', 'ULTRACEMCO.NS', 'ONGC.NS', 'TATASTEEL.NS', 'ADANIPORTS.NS',
+    'POWERGRID.NS', 'NESTLEIND.NS', 'BAJFINANCE.NS', 'BAJAJFINSV.NS', 'TECHM.NS',
+    'SUNPHARMA.NS', 'DRREDDY.NS', 'CIPLA.NS', 'DIVISLAB.NS', 'COALINDIA.NS',
+    'NTPC.NS', 'JSWSTEEL.NS', 'TATAMOTORS.NS', 'M&M.NS', 'GRASIM.NS',
+    'BRITANNIA.NS', 'SHREECEM.NS', 'EICHERMOT.NS', 'UPL.NS', 'HINDALCO.NS',
+    'BAJAJ-AUTO.NS', 'APOLLOHOSP.NS', 'HEROMOTOCO.NS', 'BPCL.NS', 'IOC.NS',
+    'INDUSINDBK.NS', 'AXISBANK.NS', 'VEDL.NS', 'ADANITRANS.NS', 'TATACONSUM.NS',
+)
+
+# NIFTY Next 50 - together with NIFTY 50 makes up NIFTY 100
+_NIFTY_NEXT_50 = (
+    'ADANIENT.NS', 'SIEMENS.NS', 'DLF.NS', 'GODREJCP.NS', 'DABUR.NS',
+    'HAVELLS.NS', 'TRENT.NS', 'BEL.NS', 'BANKBARODA.NS', 'PNB.NS',
+    'CANBK.NS', 'UNIONBANK.NS', 'INDHOTEL.NS', 'CONCOR.NS', 'BOSCHLTD.NS',
+    'TATAPOWER.NS', 'TORNTPHARM.NS', 'COLPAL.NS', 'MARICO.NS', 'PIDILITIND.NS',
+    'GLAND.NS', 'BERGEPAINT.NS', 'LUPIN.NS', 'AMBUJACEM.NS', 'ACC.NS',
+    'ICICIPRULI.NS', 'SBILIFE.NS', 'HDFCLIFE.NS', 'BAJAJHLDNG.NS', 'MOTHERSON.NS',
+    'VOLTAS.NS', 'AUBANK.NS', 'BANDHANBNK.NS', 'IDFCFIRSTB.NS', 'PEL.NS',
+    'GODREJPROP.NS', 'OBEROIRLTY.NS', 'PRESTIGE.NS', 'MCDOWELL-N.NS', 'ABB.NS',
+    'SBICARD.NS', 'INDIGO.NS', 'PETRONET.NS', 'MRF.NS', 'PAGEIND.NS',
+    'ALKEM.NS', 'BIOCON.NS', 'DMART.NS', 'NAUKRI.NS', 'ZOMATO.NS',
+)
+
+# Additional mid-cap and small-cap stocks from NIFTY 500
+_NIFTY_500_EXTRA = (
+    'PAYTM.NS', 'POLICYBZR.NS', 'ZEEL.NS', 'DIXON.NS', 'LTIM.NS',
+    'PERSISTENT.NS', 'COFORGE.NS', 'MPHASIS.NS', 'LTTS.NS', 'HAPPSTMNDS.NS',
+    'CROMPTON.NS', 'WHIRLPOOL.NS', 'CUMMINSIND.NS', 'ESCORTS.NS', 'ASHOKLEY.NS',
+    'BALKRISIND.NS', 'APOLLOTYRE.NS', 'CEATLTD.NS', 'EXIDEIND.NS', 'AMARAJABAT.NS',
+    'FORCEMOT.NS', 'TVSMOTOR.NS', 'BAJAJHIND.NS', 'METROPOLIS.NS', 'LALPATHLAB.NS',
+    'AUROPHARMA.NS', 'IPCALAB.NS', 'LAURUSLABS.NS', 'NATCOPHARM.NS', 'PFIZER.NS',
+    'ABBOTINDIA.NS', 'GLAXO.NS', 'SANOFI.NS', 'CENTRALBK.NS', 'INDIANB.NS',
+    'MAHABANK.NS', 'CHOLAFIN.NS', 'LICHSGFIN.NS', 'SHRIRAMFIN.NS', 'IIFL.NS',
+    'RECLTD.NS', 'PFC.NS', 'IRCTC.NS', 'IEX.NS', 'IRFC.NS',
+    'RAILTEL.NS', 'HAL.NS', 'BDL.NS', 'COCHINSHIP.NS', 'MAZDA.NS',
+    'GAIL.NS', 'GMRINFRA.NS', 'ADANIGREEN.NS', 'ADANIPOWER.NS', 'TATAELXSI.NS',
+    'MFSL.NS', 'GNFC.NS', 'DEEPAKNTR.NS', 'BALRAMCHIN.NS', 'TATACHEM.NS',
+    'PIIND.NS', 'SRF.NS', 'ATUL.NS', 'CHAMBLFERT.NS', 'COROMANDEL.NS',
+    'MANAPPURAM.NS', 'MUTHOOTFIN.NS', 'SJVN.NS', 'NHPC.NS', 'ZENSARTECH.NS',
+    'INTELLECT.NS', 'SONATSOFTW.NS', 'KPITTECH.NS', 'CYIENT.NS', 'RBLBANK.NS',
+    'FEDERALBNK.NS', 'IDBI.NS', 'CESC.NS', 'ADANIENSOL.NS', 'JSL.NS',
+    'SAIL.NS', 'JINDALSTEL.NS', 'NMDC.NS', 'NATIONALUM.NS', 'RATNAMANI.NS',
+    'WELCORP.NS', 'RELAXO.NS', 'BATA.NS', 'VBL.NS', 'TATACOMM.NS',
+    'BHARATFORG.NS', 'TIMKEN.NS', 'SCHNEIDER.NS', 'KEI.NS', 'POLYCAB.NS',
+    'APLAPOLLO.NS', 'ASTRAL.NS', 'SUPREMEIND.NS', 'NILKAMAL.NS', 'SYMPHONY.NS',
+    'BLUESTARCO.NS', 'VGUARD.NS', 'FINEORG.NS', 'EIDPARRY.NS', 'RAJESHEXPO.NS',
+    'MANYAVAR.NS', 'ABFRL.NS', 'SHOPERSTOP.NS', 'JUBLFOOD.NS', 'WESTLIFE.NS',
+    'SAPPHIRE.NS', 'GOCOLORS.NS', 'VMART.NS', 'BSOFT.NS', 'IRCON.NS',
+    'NBCC.NS', 'REDINGTON.NS', 'AMBER.NS', 'ROUTE.NS', 'GICRE.NS',
+    'NIACL.NS', 'STARHEALTH.NS', 'MAHLIFE.NS', 'ITI.NS', 'MTNL.NS',
+    'PVR.NS', 'PVRINOX.NS', 'BASF.NS', 'HONAUT.NS', '3MINDIA.NS',
+    'GILLETTE.NS', 'BAYERCROP.NS', 'GRINDWELL.NS', 'CARBORUNIV.NS', 'SKFINDIA.NS',
+)
+
+# SENSEX - Top 30 stocks
+_SENSEX = (
+    'RELIANCE.NS', 'TCS.NS', 'INFY.NS', 'HDFCBANK.NS', 'ICICIBANK.NS',
+    'HINDUNILVR.NS', 'SBIN.NS', 'BHARTIARTL.NS', 'ITC.NS', 'KOTAKBANK.NS',
+    'LT.NS', 'ASIANPAINT.NS', 'MARUTI.NS', 'HCLTECH.NS', 'BAJFINANCE.NS',
+    'TITAN.NS', 'ULTRACEMCO.NS', 'ONGC.NS', 'TATASTEEL.NS', 'POWERGRID.NS',
+    'NESTLEIND.NS', 'BAJAJFINSV.NS', 'TECHM.NS', 'SUNPHARMA.NS', 'NTPC.NS',
+    'JSWSTEEL.NS', 'TATAMOTORS.NS', 'M&M.NS', 'AXISBANK.NS', 'INDUSINDBK.NS',
+)
+
+# NIFTY Midcap
+_NIFTY_MIDCAP = (
+    'GODREJCP.NS', 'DABUR.NS', 'HAVELLS.NS', 'TRENT.NS', 'BEL.NS',
+    'BANKBARODA.NS', 'PNB.NS', 'CANBK.NS', 'UNIONBANK.NS', 'INDHOTEL.NS',
+    'BOSCHLTD.NS', 'TATAPOWER.NS', 'TORNTPHARM.NS', 'COLPAL.NS', 'MARICO.NS',
+    'PIDILITIND.NS', 'GLAND.NS', 'BERGEPAINT.NS', 'LUPIN.NS', 'AMBUJACEM.NS',
+    'ACC.NS', 'ICICIPRULI.NS', 'SBILIFE.NS', 'HDFCLIFE.NS', 'MOTHERSON.NS',
+    'VOLTAS.NS', 'AUBANK.NS', 'BANDHANBNK.NS', 'IDFCFIRSTB.NS', 'PEL.NS',
+    'GODREJPROP.NS', 'OBEROIRLTY.NS', 'PRESTIGE.NS', 'ABB.NS', 'SBICARD.NS',
+    'INDIGO.NS', 'PETRONET.NS', 'MRF.NS', 'ALKEM.NS', 'BIOCON.NS',
+    'DMART.NS', 'NAUKRI.NS', 'DIXON.NS', 'LTIM.NS', 'PERSISTENT.NS',
+    'COFORGE.NS', 'MPHASIS.NS', 'LTTS.NS', 'CROMPTON.NS', 'CUMMINSIND.NS',
+)
+
+# Curated constituent lists per index, used when yfinance can't provide them
+_FALLBACK_LISTS = {
+    "^NSEI": _NIFTY_50,
+    "^BSESN": _SENSEX,
+    # dict.fromkeys guards against a symbol being added to more than one base list
+    "^CNX100": tuple(dict.fromkeys(_NIFTY_50 + _NIFTY_NEXT_50)),
+    "^CRSLDX": tuple(dict.fromkeys(_NIFTY_50 + _NIFTY_NEXT_50 + _NIFTY_500_EXTRA)),
+    "NIFTY_MIDCAP": _NIFTY_MIDCAP,
+}
+
+class FileCache:
+    """
+    On-disk cache for downloaded DataFrames, stored as .cache/{key}_{YYYYMMDD}.parquet
+    
+    Entries expire after `intraday_ttl` seconds while the NSE is open
+    (9:15-15:30 IST, Mon-Fri); outside market hours an entry written after the
+    last session closed stays valid until the next session opens.
+    """
+    def __init__(self, cache_dir=".cache", intraday_ttl=300):
+        self.cache_dir = cache_dir
+        self.intraday_ttl = intraday_ttl
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    @staticmethod
+    def _session_bounds(now):
+        """
+        Return (open, close) datetimes of the current or most recent trading session
+        """
+        day = now
+        if (now.hour, now.minute) < MARKET_OPEN:
+            day -= timedelta(days=1)
+        while day.weekday() >= 5:  # Skip weekends
+            day -= timedelta(days=1)
+        session_open = day.replace(hour=MARKET_OPEN[0], minute=MARKET_OPEN[1], second=0, microsecond=0)
+        session_close = day.replace(hour=MARKET_CLOSE[0], minute=MARKET_CLOSE[1], second=0, microsecond=0)
+        return session_open, session_close
+    
+    def _path(self, key, session_date):
+        return os.path.join(self.cache_dir, f"{key}_{session_date:%Y%m%d}.parquet")
+    
+    def get(self, key):
+        """
+        Return the cached DataFrame for `key`, or None if missing or stale
+        """
+        now = datetime.now(IST)
+        session_open, session_close = self._session_bounds(now)
+        path = self._path(key, session_open)
+        if not os.path.exists(path):
+            return None
+        
+        written = datetime.fromtimestamp(os.path.getmtime(path), IST)
+        if now < session_close:
+            # Market is open: prices move, keep entries only briefly
+            if (now - written).total_seconds() > self.intraday_ttl:
+                return None
+        elif written < session_close:
+            # Written before the close, so it misses the end-of-session prices
+            return None
+        
+        try:
+            return pd.read_parquet(path)
+        except ImportError:
+            return pd.read_pickle(path)
+        except Exception:
+            return None
+    
+    def set(self, key, df):
+        """
+        Store `df` under `key` for the current trading session, removing the
+        key's files from earlier sessions
+        """
+        session_open, _ = self._session_bounds(datetime.now(IST))
+        path = self._path(key, session_open)
+        try:
+            df.to_parquet(path)
+        except ImportError:
+            # No parquet engine installed, fall back to pickle
+            df.to_pickle(path)
+        except Exception:
+            return
+        
+        pattern = os.path.join(self.cache_dir, f"{glob.escape(key)}_{'[0-9]' * 8}.parquet")
+        for old_path in glob.glob(pattern):
+            if old_path != path:
+                try:
+                    os.remove(old_path)
+                except OSError:
+                    pass
+
+def _range_and_mask(high, low, close_last):
+    """
+    52-week high/low and first-half mask per symbol for (T, N) arrays
+    """
+    with np.errstate(invalid='ignore'):
+        hi = nanmax(high, axis=0)
+        lo = nanmin(low, axis=0)
+        mask = (close_last >= lo) & (close_last <= (hi + lo) / 2)
+    return hi, lo, mask
+
+_compiled_screen_kernel = None
+
+def _get_screen_kernel():
+    """
+    Import numba and compile the fused screening kernel on first use
+    
+    Only used when IndianStockStrategy is created with use_numba=True; the
+    NumPy screen_criteria_vectorized path is the default.
+    """
+    global _compiled_screen_kernel
+    if _compiled_screen_kernel is None:
+        from numba import njit, prange
+        
+        # All fast-math flags except 'nnan'/'ninf': the kernel relies on NaN checks for missing days
+        @njit(parallel=True, cache=True, fastmath={'reassoc', 'contract', 'nsz', 'arcp', 'afn'})
+        def _screen_kernel(open_, high, low, close, month_days, week_days, min_days):
+            """
+            Evaluate all three screening criteria for (T, N) OHLC arrays in one pass per symbol
+            
+            Returns:
+                passed, week_52_high, week_52_low arrays of shape (N,)
+            """
+            T, N = close.shape
+            passed = np.zeros(N, dtype=np.bool_)
+            week_52_high = np.full(N, np.nan)
+            week_52_low = np.full(N, np.nan)
+            for j in prange(N):
+                hi = -np.inf
+                lo = np.inf
+                month_hi = -np.inf
+                month_lo = np.inf
+                week_hi = -np.inf
+                prev_week_hi = -np.inf
+                week_nan = False
+                count = 0
+                for t in range(T):
+                    h = high[t, j]
+                    l = low[t, j]
+                    if close[t, j] == close[t, j]:
+                        count += 1
+                    if h > hi:
+                        hi = h
+                    if l < lo:
+                        lo = l
+                    if t >= T - month_days:
+                        if h > month_hi:
+                            month_hi = h
+                        if l < month_lo:
+                            month_lo = l
+                    if t >= T - 2 * week_days:
+                        if h != h:
+                            week_nan = True
+                        elif t >= T - week_days:
+                            if h > week_hi:
+                                week_hi = h
+                        elif h > prev_week_hi:
+                            prev_week_hi = h
+                if hi == -np.inf or lo == np.inf:
+                    continue
+                week_52_high[j] = hi
+                week_52_low[j] = lo
+                
+                c = close[T - 1, j]
+                if count < min_days or T < 2 * week_days or c != c:
+                    continue
+                
+                # Criterion 1: first half of the 52-week range
+                criterion_1 = c >= lo and c <= (hi + lo) / 2
+                # Criterion 2: 75%-100% of the monthly candle
+                criterion_2 = c >= month_lo + 0.75 * (month_hi - month_lo) and c <= month_hi
+                # Criterion 3: green weekly candle or higher high than previous week
+                criterion_3 = c > open_[T - week_days, j] or (not week_nan and week_hi > prev_week_hi)
+                passed[j] = criterion_1 and criterion_2 and criterion_3
+            return passed, week_52_high, week_52_low
+        
+        _compiled_screen_kernel = _screen_kernel
+    return _compiled_screen_kernel
+
+# Price columns kept from downloaded history
+PRICE_FIELDS = ['Open', 'High', 'Low', 'Close']
+
+def _price_columns(data):
+    """
+    Keep only the OHLC columns the criteria read, narrowed to float32, on a tz-naive index
+    
+    yf.download returns tz-naive daily dates while Ticker.history returns
+    Asia/Kolkata ones; both share cache keys and are concatenated into the panel.
+    """
+    data = data[PRICE_FIELDS].astype(np.float32, copy=False)
+    if getattr(data.index, 'tz', None) is not None:
+        data.index = data.index.tz_localize(None)
+    return data
+
+def _fetch_one_history(args):
+    """
+    Fetch OHLC history for a single symbol (module-level so worker processes can pickle it)
+    """
+    symbol, period = args
+    try:
+        # Raw OHLC, matching the batch download's auto_adjust=False
+        data = _yf().Ticker(symbol).history(period=period, auto_adjust=False, actions=False)
+        return symbol, _price_columns(data)
+    except Exception:
+        return symbol, None
+
+# Columns of the DataFrame returned by IndianStockStrategy.screen_all_stocks
+RESULT_COLUMNS = [
+    'symbol', 'current_price', 'entry_price', 'stop_loss', 'target_price',
+    'quantity', 'risk_amount', 'profit_potential', 'risk_reward_ratio',
+    'market_cap', '52_week_high', '52_week_low', 'position_value',
+    'criterion_1', 'criterion_2', 'criterion_3'
+]
+
 class IndianStockStrategy:
-    def __init__(self, portfolio_capital=10000, index="^NSEI"):
+    def __init__(self, portfolio_capital=10000, index="^NSEI", cache_dir=".cache", use_numba=False):
         """
         Initialize the strategy with portfolio capital and index selection
         
@@ -45,145 +376,33 @@ class IndianStockStrategy:
                    - "^BSESN" : SENSEX (30 stocks)
                    - "^CNX100" : NIFTY 100 (100 stocks)
                    - "NIFTY_MIDCAP" : NIFTY Midcap (custom list)
+            cache_dir: Directory for the on-disk data cache (None disables caching)
+            use_numba: Screen with the fused Numba kernel instead of NumPy (needs numba;
+                       only pays off on panels of many thousands of symbols)
         """
         self.portfolio_capital = portfolio_capital
         self.max_risk_per_trade = 0.02  # 2%
         self.max_position_size = 0.10   # 10%
         self.max_risk_amount = self.portfolio_capital * self.max_risk_per_trade
         self.max_position_amount = self.portfolio_capital * self.max_position_size
+        self.cache = FileCache(cache_dir) if cache_dir else None
+        self.use_numba = use_numba and NUMBA_AVAILABLE
+        if use_numba and not NUMBA_AVAILABLE:
+            print("⚠️  numba is not installed, screening with NumPy")
         
         # Fetch list of Indian stocks using yfinance NSE indices
         self.indian_stocks = self._get_nifty_symbols(index=index)
+        self._cap_cache = {}
         print(f"\n✓ Loaded {len(self.indian_stocks)} stocks for screening\n")
+        
+        # Batch-downloaded price history, filled by screen_all_stocks
+        self.all_data = None
 
     def _get_fallback_stocks(self, index):
         """
         Get fallback stock lists for different Indian indices
         """
-        fallback_lists = {
-            # NIFTY 50 - Top 50 large-cap stocks
-            "^NSEI": [
-                'RELIANCE.NS', 'TCS.NS', 'INFY.NS', 'HDFCBANK.NS', 'ICICIBANK.NS',
-                'HINDUNILVR.NS', 'SBIN.NS', 'BHARTIARTL.NS', 'ITC.NS', 'KOTAKBANK.NS',
-                'LT.NS', 'ASIANPAINT.NS', 'MARUTI.NS', 'HCLTECH.NS', 'WIPRO.NS',
-                'TITAN.NS', 'ULTRACEMCO.NS', 'ONGC.NS', 'TATASTEEL.NS', 'ADANIPORTS.NS',
-                'POWERGRID.NS', 'NESTLEIND.NS', 'BAJFINANCE.NS', 'BAJAJFINSV.NS',
-                'TECHM.NS', 'SUNPHARMA.NS', 'DRREDDY.NS', 'CIPLA.NS', 'DIVISLAB.NS',
-                'COALINDIA.NS', 'NTPC.NS', 'JSWSTEEL.NS', 'TATAMOTORS.NS', 'M&M.NS',
-                'GRASIM.NS', 'BRITANNIA.NS', 'SHREECEM.NS', 'EICHERMOT.NS', 'UPL.NS',
-                'HINDALCO.NS', 'BAJAJ-AUTO.NS', 'APOLLOHOSP.NS', 'HEROMOTOCO.NS',
-                'BPCL.NS', 'IOC.NS', 'INDUSINDBK.NS', 'AXISBANK.NS', 'VEDL.NS',
-                'ADANITRANS.NS', 'TATACONSUM.NS'
-            ],
-            
-            # SENSEX - Top 30 stocks
-            "^BSESN": [
-                'RELIANCE.NS', 'TCS.NS', 'INFY.NS', 'HDFCBANK.NS', 'ICICIBANK.NS',
-                'HINDUNILVR.NS', 'SBIN.NS', 'BHARTIARTL.NS', 'ITC.NS', 'KOTAKBANK.NS',
-                'LT.NS', 'ASIANPAINT.NS', 'MARUTI.NS', 'HCLTECH.NS', 'BAJFINANCE.NS',
-                'TITAN.NS', 'ULTRACEMCO.NS', 'ONGC.NS', 'TATASTEEL.NS', 'POWERGRID.NS',
-                'NESTLEIND.NS', 'BAJAJFINSV.NS', 'TECHM.NS', 'SUNPHARMA.NS',
-                'NTPC.NS', 'JSWSTEEL.NS', 'TATAMOTORS.NS', 'M&M.NS', 'AXISBANK.NS', 'INDUSINDBK.NS'
-            ],
-            
-            # NIFTY 100 - Includes NIFTY 50 + Next 50
-            "^CNX100": [
-                # NIFTY 50 stocks
-                'RELIANCE.NS', 'TCS.NS', 'INFY.NS', 'HDFCBANK.NS', 'ICICIBANK.NS',
-                'HINDUNILVR.NS', 'SBIN.NS', 'BHARTIARTL.NS', 'ITC.NS', 'KOTAKBANK.NS',
-                'LT.NS', 'ASIANPAINT.NS', 'MARUTI.NS', 'HCLTECH.NS', 'WIPRO.NS',
-                'TITAN.NS', 'ULTRACEMCO.NS', 'ONGC.NS', 'TATASTEEL.NS', 'ADANIPORTS.NS',
-                'POWERGRID.NS', 'NESTLEIND.NS', 'BAJFINANCE.NS', 'BAJAJFINSV.NS',
-                'TECHM.NS', 'SUNPHARMA.NS', 'DRREDDY.NS', 'CIPLA.NS', 'DIVISLAB.NS',
-                'COALINDIA.NS', 'NTPC.NS', 'JSWSTEEL.NS', 'TATAMOTORS.NS', 'M&M.NS',
-                'GRASIM.NS', 'BRITANNIA.NS', 'SHREECEM.NS', 'EICHERMOT.NS', 'UPL.NS',
-                'HINDALCO.NS', 'BAJAJ-AUTO.NS', 'APOLLOHOSP.NS', 'HEROMOTOCO.NS',
-                'BPCL.NS', 'IOC.NS', 'INDUSINDBK.NS', 'AXISBANK.NS', 'VEDL.NS',
-                'ADANITRANS.NS', 'TATACONSUM.NS',
-                # Next 50 stocks
-                'ADANIENT.NS', 'SIEMENS.NS', 'DLF.NS', 'GODREJCP.NS', 'DABUR.NS',
-                'HAVELLS.NS', 'TRENT.NS', 'BEL.NS', 'BANKBARODA.NS', 'PNB.NS',
-                'CANBK.NS', 'UNIONBANK.NS', 'INDHOTEL.NS', 'CONCOR.NS', 'BOSCHLTD.NS',
-                'TATAPOWER.NS', 'TORNTPHARM.NS', 'COLPAL.NS', 'MARICO.NS', 'PIDILITIND.NS',
-                'GLAND.NS', 'BERGEPAINT.NS', 'LUPIN.NS', 'AMBUJACEM.NS', 'ACC.NS',
-                'ICICIPRULI.NS', 'SBILIFE.NS', 'HDFCLIFE.NS', 'BAJAJHLDNG.NS', 'MOTHERSON.NS',
-                'VOLTAS.NS', 'AUBANK.NS', 'BANDHANBNK.NS', 'IDFCFIRSTB.NS', 'PEL.NS',
-                'GODREJPROP.NS', 'OBEROIRLTY.NS', 'PRESTIGE.NS', 'MCDOWELL-N.NS', 'ABB.NS',
-                'SBICARD.NS', 'INDIGO.NS', 'PETRONET.NS', 'MRF.NS', 'PAGEIND.NS',
-                'ALKEM.NS', 'BIOCON.NS', 'DMART.NS', 'NAUKRI.NS', 'ZOMATO.NS'
-            ],
-            
-            # NIFTY 500 - Comprehensive list (top stocks from NIFTY 500)
-            "^CRSLDX": [
-                # All NIFTY 100 stocks plus additional mid-cap and small-cap stocks
-                'RELIANCE.NS', 'TCS.NS', 'INFY.NS', 'HDFCBANK.NS', 'ICICIBANK.NS',
-                'HINDUNILVR.NS', 'SBIN.NS', 'BHARTIARTL.NS', 'ITC.NS', 'KOTAKBANK.NS',
-                'LT.NS', 'ASIANPAINT.NS', 'MARUTI.NS', 'HCLTECH.NS', 'WIPRO.NS',
-                'TITAN.NS', 'ULTRACEMCO.NS', 'ONGC.NS', 'TATASTEEL.NS', 'ADANIPORTS.NS',
-                'POWERGRID.NS', 'NESTLEIND.NS', 'BAJFINANCE.NS', 'BAJAJFINSV.NS',
-                'TECHM.NS', 'SUNPHARMA.NS', 'DRREDDY.NS', 'CIPLA.NS', 'DIVISLAB.NS',
-                'COALINDIA.NS', 'NTPC.NS', 'JSWSTEEL.NS', 'TATAMOTORS.NS', 'M&M.NS',
-                'GRASIM.NS', 'BRITANNIA.NS', 'SHREECEM.NS', 'EICHERMOT.NS', 'UPL.NS',
-                'HINDALCO.NS', 'BAJAJ-AUTO.NS', 'APOLLOHOSP.NS', 'HEROMOTOCO.NS',
-                'BPCL.NS', 'IOC.NS', 'INDUSINDBK.NS', 'AXISBANK.NS', 'VEDL.NS',
-                'ADANITRANS.NS', 'TATACONSUM.NS', 'ADANIENT.NS', 'SIEMENS.NS', 'DLF.NS',
-                # Additional NIFTY 500 stocks
-                'GODREJCP.NS', 'DABUR.NS', 'HAVELLS.NS', 'TRENT.NS', 'BEL.NS',
-                'BANKBARODA.NS', 'PNB.NS', 'CANBK.NS', 'UNIONBANK.NS', 'INDHOTEL.NS',
-                'CONCOR.NS', 'BOSCHLTD.NS', 'TATAPOWER.NS', 'TORNTPHARM.NS', 'COLPAL.NS',
-                'MARICO.NS', 'PIDILITIND.NS', 'GLAND.NS', 'BERGEPAINT.NS', 'LUPIN.NS',
-                'AMBUJACEM.NS', 'ACC.NS', 'ICICIPRULI.NS', 'SBILIFE.NS', 'HDFCLIFE.NS',
-                'BAJAJHLDNG.NS', 'MOTHERSON.NS', 'VOLTAS.NS', 'AUBANK.NS', 'BANDHANBNK.NS',
-                'IDFCFIRSTB.NS', 'PEL.NS', 'GODREJPROP.NS', 'OBEROIRLTY.NS', 'PRESTIGE.NS',
-                'MCDOWELL-N.NS', 'ABB.NS', 'SBICARD.NS', 'INDIGO.NS', 'PETRONET.NS',
-                'MRF.NS', 'PAGEIND.NS', 'ALKEM.NS', 'BIOCON.NS', 'DMART.NS',
-                'NAUKRI.NS', 'ZOMATO.NS', 'PAYTM.NS', 'POLICYBZR.NS', 'ZEEL.NS',
-                'DIXON.NS', 'LTIM.NS', 'PERSISTENT.NS', 'COFORGE.NS', 'MPHASIS.NS',
-                'LTTS.NS', 'HAPPSTMNDS.NS', 'CROMPTON.NS', 'WHIRLPOOL.NS', 'CUMMINSIND.NS',
-                'ESCORTS.NS', 'ASHOKLEY.NS', 'BALKRISIND.NS', 'APOLLOTYRE.NS', 'CEATLTD.NS',
-                'EXIDEIND.NS', 'AMARAJABAT.NS', 'FORCEMOT.NS', 'TVSMOTOR.NS', 'BAJAJHIND.NS',
-                'METROPOLIS.NS', 'LALPATHLAB.NS', 'AUROPHARMA.NS', 'IPCALAB.NS', 'LAURUSLABS.NS',
-                'NATCOPHARM.NS', 'PFIZER.NS', 'ABBOTINDIA.NS', 'GLAXO.NS', 'SANOFI.NS',
-                'CENTRALBK.NS', 'INDIANB.NS', 'MAHABANK.NS', 'CHOLAFIN.NS',
-                'LICHSGFIN.NS', 'SHRIRAMFIN.NS', 'IIFL.NS', 'RECLTD.NS', 'PFC.NS',
-                'IRCTC.NS', 'IEX.NS', 'IRFC.NS', 'RAILTEL.NS', 'HAL.NS',
-                'BDL.NS', 'COCHINSHIP.NS', 'MAZDA.NS', 'GAIL.NS', 'GMRINFRA.NS',
-                'ADANIGREEN.NS', 'ADANIPOWER.NS', 'TATAELXSI.NS', 'MFSL.NS', 'GNFC.NS',
-                'DEEPAKNTR.NS', 'BALRAMCHIN.NS', 'TATACHEM.NS', 'PIIND.NS',
-                'SRF.NS', 'ATUL.NS', 'CHAMBLFERT.NS', 'COROMANDEL.NS', 'MANAPPURAM.NS',
-                'MUTHOOTFIN.NS', 'SJVN.NS', 'NHPC.NS', 'ZENSARTECH.NS', 'INFY.NS',
-                'INTELLECT.NS', 'SONATSOFTW.NS', 'KPITTECH.NS', 'CYIENT.NS', 'RBLBANK.NS',
-                'FEDERALBNK.NS', 'IDBI.NS', 'CESC.NS', 'ADANIENSOL.NS', 'JSL.NS',
-                'SAIL.NS', 'JINDALSTEL.NS', 'NMDC.NS', 'NATIONALUM.NS', 'RATNAMANI.NS',
-                'WELCORP.NS', 'RELAXO.NS', 'BATA.NS', 'VBL.NS', 'TATACOMM.NS',
-                'BHARATFORG.NS', 'TIMKEN.NS', 'SCHNEIDER.NS', 'CROMPTON.NS', 'KEI.NS',
-                'POLYCAB.NS', 'APLAPOLLO.NS', 'ASTRAL.NS', 'SUPREMEIND.NS', 'NILKAMAL.NS',
-                'SYMPHONY.NS', 'BLUESTARCO.NS', 'VGUARD.NS', 'FINEORG.NS', 'EIDPARRY.NS',
-                'RAJESHEXPO.NS', 'TITAN.NS', 'MANYAVAR.NS', 'ABFRL.NS',
-                'TRENT.NS', 'SHOPERSTOP.NS', 'JUBLFOOD.NS', 'WESTLIFE.NS', 'SAPPHIRE.NS',
-                'GOCOLORS.NS', 'VMART.NS', 'BSOFT.NS', 'IRCON.NS', 'NBCC.NS',
-                'REDINGTON.NS', 'AMBER.NS', 'ROUTE.NS', 'GICRE.NS', 'NIACL.NS',
-                'STARHEALTH.NS', 'MAHLIFE.NS', 'ITI.NS', 'MTNL.NS', 'PVR.NS',
-                'PVRINOX.NS', 'BASF.NS', 'HONAUT.NS', '3MINDIA.NS',
-                'GILLETTE.NS', 'BAYERCROP.NS', 'GRINDWELL.NS', 'CARBORUNIV.NS', 'SKFINDIA.NS'
-            ],
-            
-            # NIFTY Midcap
-            "NIFTY_MIDCAP": [
-                'GODREJCP.NS', 'DABUR.NS', 'HAVELLS.NS', 'TRENT.NS', 'BEL.NS',
-                'BANKBARODA.NS', 'PNB.NS', 'CANBK.NS', 'UNIONBANK.NS', 'INDHOTEL.NS',
-                'BOSCHLTD.NS', 'TATAPOWER.NS', 'TORNTPHARM.NS', 'COLPAL.NS', 'MARICO.NS',
-                'PIDILITIND.NS', 'GLAND.NS', 'BERGEPAINT.NS', 'LUPIN.NS', 'AMBUJACEM.NS',
-                'ACC.NS', 'ICICIPRULI.NS', 'SBILIFE.NS', 'HDFCLIFE.NS', 'MOTHERSON.NS',
-                'VOLTAS.NS', 'AUBANK.NS', 'BANDHANBNK.NS', 'IDFCFIRSTB.NS', 'PEL.NS',
-                'GODREJPROP.NS', 'OBEROIRLTY.NS', 'PRESTIGE.NS', 'ABB.NS', 'SBICARD.NS',
-                'INDIGO.NS', 'PETRONET.NS', 'MRF.NS', 'ALKEM.NS', 'BIOCON.NS',
-                'DMART.NS', 'NAUKRI.NS', 'DIXON.NS', 'LTIM.NS', 'PERSISTENT.NS',
-                'COFORGE.NS', 'MPHASIS.NS', 'LTTS.NS', 'CROMPTON.NS', 'CUMMINSIND.NS'
-            ]
-        }
-        
-        return fallback_lists.get(index, fallback_lists["^NSEI"])
+        return list(_FALLBACK_LISTS.get(index, _FALLBACK_LISTS["^NSEI"]))
     
     # Dynamically fetch list of Indian stocks using yfinance NSE indices (e.g. NIFTY 50/NIFTY 100)
     def _get_nifty_symbols(self, index="^NSEI"):
@@ -215,7 +434,7 @@ class IndianStockStrategy:
         
         # Try fetching from yfinance (usually doesn't work for Indian indices)
         try:
-            nifty_etf = yf.Ticker(index)
+            nifty_etf = _yf().Ticker(index)
             if hasattr(nifty_etf, 'constituents'):
                 constituents = nifty_etf.constituents
                 if constituents is not None and len(constituents) > 0:
@@ -230,13 +449,44 @@ class IndianStockStrategy:
         print(f"✓ Using curated list of {len(fallback_stocks)} {index_name} stocks")
         return fallback_stocks
         
+    def _prefetch_market_caps(self, max_workers=16):
+        """
+        Fetch market caps for all symbols concurrently and store them in the cache
+        """
+        if self.cache is not None and not self._cap_cache:
+            cached = self.cache.get("market_caps")
+            if cached is not None:
+                self._cap_cache.update(
+                    (symbol, cap) for symbol, cap in cached['market_cap'].items() if cap > 0
+                )
+        
+        symbols = [s for s in self.indian_stocks if s not in self._cap_cache]
+        if not symbols:
+            return
+        print(f"🏦 Fetching market caps for {len(symbols)} stocks...")
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            self._cap_cache.update(zip(symbols, ex.map(self._fetch_one_cap, symbols)))
+        
+        if self.cache is not None:
+            # Only persist successful lookups so a transient failure is retried next run
+            caps = pd.Series(self._cap_cache, dtype=float)
+            self.cache.set("market_caps", pd.DataFrame({'market_cap': caps[caps > 0]}))
+    
     def get_market_cap(self, symbol):
+        """
+        Get market cap in crores (served from the prefetched cache when available)
+        """
+        if symbol not in self._cap_cache:
+            self._cap_cache[symbol] = self._fetch_one_cap(symbol)
+        return self._cap_cache[symbol]
+    
+    def _fetch_one_cap(self, symbol):
         """
         Get market cap in crores (Note: This is a simplified approach)
         In real implementation, you'd need actual market cap data from financial APIs
         """
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = _yf().Ticker(symbol)
             info = ticker.info
             market_cap_usd = info.get('marketCap', 0)
             # Convert to INR crores (approximate: 1 USD = 83 INR, 1 crore = 10M)
@@ -245,13 +495,106 @@ class IndianStockStrategy:
         except:
             return 0
     
+    def _download_all_data(self, symbols, period="1y"):
+        """
+        Download price history for all symbols with a single yf.download call.
+        Symbols found in the on-disk cache are not downloaded again.
+        Returns a DataFrame with (symbol, field) columns, or None on failure.
+        """
+        frames = {}
+        if self.cache is not None:
+            for symbol in symbols:
+                cached = self.cache.get(f"{symbol}_{period}")
+                if cached is not None:
+                    frames[symbol] = _price_columns(cached)
+            if frames:
+                print(f"💾 Loaded {len(frames)} stocks from cache")
+        
+        missing = [s for s in symbols if s not in frames]
+        if missing:
+            print(f"📥 Downloading {period} history for {len(missing)} stocks...")
+            try:
+                downloaded = _yf().download(
+                    tickers=missing,
+                    period=period,
+                    group_by='ticker',
+                    threads=True,
+                    auto_adjust=False,
+                    actions=False,
+                    progress=False
+                )
+            except Exception:
+                downloaded = None
+            
+            if downloaded is not None and len(downloaded) > 0:
+                for symbol in missing:
+                    if symbol not in downloaded.columns.get_level_values(0):
+                        continue
+                    data = _price_columns(downloaded[symbol]).dropna(how='all')
+                    if len(data) == 0:
+                        continue
+                    frames[symbol] = data
+                    if self.cache is not None:
+                        self.cache.set(f"{symbol}_{period}", data)
+        
+            # Batch call failed or skipped some symbols: fetch those per ticker in parallel
+            failed = [s for s in missing if s not in frames]
+            if failed:
+                frames.update(self._fetch_histories_parallel(failed, period))
+                skipped = [s for s in failed if s not in frames]
+                if skipped:
+                    print(f"⚠️  No history for {len(skipped)} stocks, left out of screening: "
+                          f"{', '.join(skipped)}")
+        
+        if not frames:
+            return None
+        return pd.concat(frames, axis=1)
+    
+    def _fetch_histories_parallel(self, symbols, period="1y", processes=16):
+        """
+        Fetch history per ticker with a process pool, used when the batch download fails
+        """
+        print(f"🔁 Fetching {len(symbols)} stocks individually...")
+        frames = {}
+        try:
+            with mp.Pool(min(processes, len(symbols))) as pool:
+                tasks = [(symbol, period) for symbol in symbols]
+                for i, (symbol, data) in enumerate(pool.imap_unordered(_fetch_one_history, tasks), 1):
+                    if data is not None:
+                        data = data.dropna(how='all')
+                    if data is not None and len(data) > 0:
+                        frames[symbol] = data
+                        if self.cache is not None:
+                            self.cache.set(f"{symbol}_{period}", data)
+                    if i % 25 == 0 or i == len(symbols):
+                        print(f"   {i}/{len(symbols)} fetched")
+        except Exception as e:
+            # Symbols not fetched before the failure are left out of the panel
+            print(f"⚠️  Parallel fetch failed: {e}")
+        return frames
+    
     def get_stock_data(self, symbol, period="1y"):
         """
         Get stock data for analysis
         """
+        # Use the batch-downloaded panel when it has this symbol
+        if (period == "1y" and self.all_data is not None
+                and symbol in self.all_data.columns.get_level_values(0)):
+            data = self.all_data[symbol].dropna()
+            return data if len(data) > 0 else None
+        
+        key = f"{symbol}_{period}"
+        if self.cache is not None:
+            data = self.cache.get(key)
+            if data is not None:
+                return _price_columns(data)
+        
         try:
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period=period)
+            ticker = _yf().Ticker(symbol)
+            # Raw OHLC, matching the batch download's auto_adjust=False
+            data = _price_columns(ticker.history(period=period, auto_adjust=False, actions=False))
+            if self.cache is not None and len(data) > 0:
+                self.cache.set(key, data)
             return data
         except:
             return None
@@ -260,8 +603,8 @@ class IndianStockStrategy:
         """
         Calculate 52-week high and low
         """
-        week_52_high = data['High'].max()
-        week_52_low = data['Low'].min()
+        week_52_high = nanmax(data['High'].to_numpy())
+        week_52_low = nanmin(data['Low'].to_numpy())
         midpoint = (week_52_high + week_52_low) / 2
         return week_52_high, week_52_low, midpoint
     
@@ -272,17 +615,17 @@ class IndianStockStrategy:
         midpoint = (week_52_high + week_52_low) / 2
         return week_52_low <= current_price <= midpoint
     
-    def check_monthly_candle_criterion(self, data, current_price):
+    def check_monthly_candle_criterion(self, data, current_price, month_days=MONTH_DAYS):
         """
         Check if price lies in 75%-100% of current month candle range
         """
-        # Get current month data
-        current_month = data.last('30D')
+        # Get current month data (~1 month of trading days)
+        current_month = data.iloc[-month_days:]
         if len(current_month) == 0:
             return False
         
-        monthly_high = current_month['High'].max()
-        monthly_low = current_month['Low'].min()
+        monthly_high = nanmax(current_month['High'].to_numpy())
+        monthly_low = nanmin(current_month['Low'].to_numpy())
         range_75_percent = monthly_low + 0.75 * (monthly_high - monthly_low)
         
         return range_75_percent <= current_price <= monthly_high
@@ -291,28 +634,28 @@ class IndianStockStrategy:
         """
         Check if weekly candle is green or has more buying than previous week
         """
-        # Get last two weeks of data
-        weekly_data = data.resample('W').agg({
-            'Open': 'first',
-            'High': 'max',
-            'Low': 'min',
-            'Close': 'last',
-            'Volume': 'sum'
-        }).dropna()
-        
-        if len(weekly_data) < 2:
-            return False
-        
-        current_week = weekly_data.iloc[-1]
-        previous_week = weekly_data.iloc[-2]
+        return bool(self._weekly_candle_mask(
+            data['Open'].to_numpy(), data['High'].to_numpy(), data['Close'].to_numpy()
+        ))
+    
+    @staticmethod
+    def _weekly_candle_mask(open_, high, close, week_days=WEEK_DAYS):
+        """
+        Weekly candle criterion on daily arrays of shape (T,) or (T, N)
         
-        # Check if current week is green
-        is_green = current_week['Close'] > current_week['Open']
+        The last `week_days` trading days form the current week and the
+        `week_days` before them the previous week.
+        """
+        if len(close) < 2 * week_days:
+            return np.zeros(close.shape[1:], dtype=bool)
         
-        # Check if current week has higher high than previous week
-        higher_high = current_week['High'] > previous_week['High']
+        curr_open = open_[-week_days]
+        curr_close = close[-1]
+        curr_high = high[-week_days:].max(axis=0)
+        prev_high = high[-2 * week_days:-week_days].max(axis=0)
         
-        return is_green or higher_high
+        # Green weekly candle, or higher high than previous week
+        return (curr_close > curr_open) | (curr_high > prev_high)
     
     def calculate_position_size(self, current_price, stop_loss, target_price):
         """
@@ -350,6 +693,28 @@ class IndianStockStrategy:
         
         return quantity, actual_risk, potential_profit
     
+    def _position_size_vec(self, current_price, stop_loss, target_price):
+        """
+        Vectorized calculate_position_size over arrays of candidates
+        
+        Returns:
+            quantity, actual_risk, potential_profit arrays (all zero where the setup is invalid)
+        """
+        risk_per_share = current_price - stop_loss
+        reward_per_share = target_price - current_price
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            risk_reward_ratio = reward_per_share / risk_per_share
+            valid = (risk_per_share > 0) & (risk_reward_ratio > 1)
+            
+            # Minimum of the 2% risk and 10% position size limits
+            # floor(a / b) rather than a // b to match int() truncation in calculate_position_size
+            quantity = np.minimum(np.floor(self.max_risk_amount / risk_per_share),
+                                  np.floor(self.max_position_amount / current_price))
+            quantity = np.where(valid & (quantity > 0), quantity, 0).astype(np.int64)
+        
+        return quantity, quantity * risk_per_share, quantity * reward_per_share
+    
     def screen_stock(self, symbol):
         """
         Screen a single stock based on all criteria
@@ -361,7 +726,7 @@ class IndianStockStrategy:
         
         # Get stock data
         data = self.get_stock_data(symbol)
-        if data is None or len(data) < 50:  # Need sufficient data
+        if data is None or len(data) < MIN_HISTORY_DAYS:  # Need sufficient data
             return None
         
         current_price = data['Close'].iloc[-1]
@@ -375,6 +740,14 @@ class IndianStockStrategy:
         if not (criterion_1 and criterion_2 and criterion_3):
             return None
         
+        return self._build_result(symbol, market_cap, current_price, week_52_high, week_52_low,
+                                  criterion_1, criterion_2, criterion_3)
+    
+    def _build_result(self, symbol, market_cap, current_price, week_52_high, week_52_low,
+                      criterion_1, criterion_2, criterion_3):
+        """
+        Size the position for a stock that passed screening and build its result record
+        """
         # Calculate position sizing
         stop_loss = week_52_low
         target_price = week_52_high
@@ -404,20 +777,153 @@ class IndianStockStrategy:
             'criterion_3': criterion_3
         }
     
-    def screen_all_stocks(self):
+    def _panel_arrays(self):
+        """
+        Split the batch-downloaded panel into (dates x symbols) arrays per field
+        
+        The panel's dates are the union over all symbols, so each column is
+        compacted: rows missing any OHLC value are moved to the top as NaN and
+        the symbol's valid rows end at the last row, matching what
+        get_stock_data(...).dropna() gives the per-symbol path.
+        
+        Returns:
+            symbols, arrays where arrays maps field -> float32 ndarray of shape (T, N)
+        """
+        symbols = list(dict.fromkeys(self.all_data.columns.get_level_values(0)))
+        raw = {
+            field: self.all_data.xs(field, level=1, axis=1).reindex(columns=symbols)
+                                .to_numpy(dtype=np.float32)
+            for field in PRICE_FIELDS
+        }
+        valid = np.logical_and.reduce([~np.isnan(a) for a in raw.values()])
+        # Stable sort puts invalid rows first while keeping the valid rows in date order
+        order = np.argsort(valid, axis=0, kind='stable')
+        
+        # Column-major so each symbol's time series is contiguous for the axis=0 reductions
+        arrays = {
+            field: np.asfortranarray(
+                np.take_along_axis(np.where(valid, a, np.nan), order, axis=0)
+            )
+            for field, a in raw.items()
+        }
+        return symbols, arrays
+    
+    def screen_criteria_vectorized(self, month_days=MONTH_DAYS):
         """
-        Screen all stocks and return qualifying ones
+        Evaluate all three criteria for every symbol in the panel at once
+        
+        Returns:
+            symbols, metrics where metrics maps name -> ndarray of shape (N,) (criterion masks, prices)
         """
-        qualified_stocks = []
+        symbols, arrays = self._panel_arrays()
+        high, low, close = arrays['High'], arrays['Low'], arrays['Close']
+        close_last = close[-1]
         
+        with np.errstate(invalid='ignore'):
+            # Criterion 1: first half of the 52-week range
+            week_52_high, week_52_low, mask1 = _range_and_mask(high, low, close_last)
+            
+            # Criterion 2: 75%-100% of the monthly candle
+            monthly_high = nanmax(high[-month_days:], axis=0)
+            monthly_low = nanmin(low[-month_days:], axis=0)
+            range_75_percent = monthly_low + 0.75 * (monthly_high - monthly_low)
+            mask2 = (close_last >= range_75_percent) & (close_last <= monthly_high)
+            
+            # Criterion 3: green weekly candle or higher high than previous week
+            mask3 = self._weekly_candle_mask(arrays['Open'], high, close)
+        
+        # Need sufficient data
+        enough_data = np.count_nonzero(~np.isnan(close), axis=0) >= MIN_HISTORY_DAYS
+        
+        metrics = {
+            'criterion_1': mask1,
+            'criterion_2': mask2,
+            'criterion_3': mask3,
+            'enough_data': enough_data,
+            'current_price': close_last,
+            '52_week_high': week_52_high,
+            '52_week_low': week_52_low,
+        }
+        return symbols, metrics
+    
+    def screen_all_stocks(self):
+        """
+        Screen all stocks and return qualifying ones as a DataFrame (one row per stock)
+        """
+        self._prefetch_market_caps()
+        
+        # Only download history for stocks that pass the market cap filter
+        eligible = [s for s in self.indian_stocks if self._cap_cache.get(s, 0) >= 1000]
+        print(f"✓ {len(eligible)} of {len(self.indian_stocks)} stocks have market cap ≥ ₹1000 crores")
+        
+        # Download 1 year of history for all eligible symbols in one batched, multi-threaded request
+        self.all_data = self._download_all_data(eligible) if eligible else None
+        if self.all_data is None:
+            # Both the batch download and the per-ticker pool came back empty;
+            # don't hit Yahoo a third time one symbol at a time
+            if eligible:
+                print("⚠️  Could not download price history, no stocks screened")
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+        
+        return self._screen_all_vectorized()
+
+    def _screen_all_vectorized(self):
+        """
+        Screen all stocks in the batch panel, sizing positions only for those passing every criterion
+        """
         print("Screening stocks...")
-        for i, symbol in enumerate(self.indian_stocks):
-            print(f"Processing {symbol} ({i+1}/{len(self.indian_stocks)})")
-            result = self.screen_stock(symbol)
-            if result:
-                qualified_stocks.append(result)
+        if self.use_numba:
+            # Single fused pass over the panel
+            symbols, arrays = self._panel_arrays()
+            passed, week_52_high, week_52_low = _get_screen_kernel()(
+                arrays['Open'], arrays['High'], arrays['Low'], arrays['Close'],
+                MONTH_DAYS, WEEK_DAYS, MIN_HISTORY_DAYS
+            )
+            current_price = arrays['Close'][-1]
+        else:
+            symbols, metrics = self.screen_criteria_vectorized()
+            passed = (metrics['criterion_1'] & metrics['criterion_2'] & metrics['criterion_3']
+                      & metrics['enough_data'])
+            current_price = metrics['current_price']
+            week_52_high = metrics['52_week_high']
+            week_52_low = metrics['52_week_low']
+        
+        qualified_idx = np.where(passed)[0]
+        syms = np.asarray(symbols, dtype=object)[qualified_idx]
+        market_cap = np.array([self.get_market_cap(s) for s in syms], dtype=np.float64)
+        current_price = current_price[qualified_idx]
+        week_52_high = week_52_high[qualified_idx]
+        week_52_low = week_52_low[qualified_idx]
+        
+        # Stop loss at the 52-week low, target at the 52-week high
+        quantity, risk_amount, profit_potential = self._position_size_vec(
+            current_price, week_52_low, week_52_high
+        )
         
-        return qualified_stocks
+        keep = quantity > 0
+        quantity = quantity[keep]
+        current_price = current_price[keep]
+        risk_amount = risk_amount[keep]
+        profit_potential = profit_potential[keep]
+        
+        return pd.DataFrame({
+            'symbol': syms[keep],
+            'current_price': current_price,
+            'entry_price': current_price,
+            'stop_loss': week_52_low[keep],
+            'target_price': week_52_high[keep],
+            'quantity': quantity,
+            'risk_amount': risk_amount,
+            'profit_potential': profit_potential,
+            'risk_reward_ratio': profit_potential / risk_amount,
+            'market_cap': market_cap[keep],
+            '52_week_high': week_52_high[keep],
+            '52_week_low': week_52_low[keep],
+            'position_value': current_price * quantity,
+            'criterion_1': True,
+            'criterion_2': True,
+            'criterion_3': True
+        }, columns=RESULT_COLUMNS)
 
 # ============================================================================
 # MAIN SCRIPT - CONFIGURE YOUR SETTINGS HERE
@@ -434,36 +940,38 @@ INDEX = "^CRSLDX"  # ← Change this to select different index
 # "^CNX100"      - NIFTY 100 (100 large-cap stocks)
 # "NIFTY_MIDCAP" - NIFTY Midcap (50 mid-cap stocks)
 
-# Initialize strategy
-print("=" * 60)
-print("          INDIAN STOCK SCREENING STRATEGY")
-print("=" * 60)
-print(f"\n💰 Portfolio Capital: ₹{PORTFOLIO_CAPITAL:,}")
-print(f"⚠️  Max Risk per Trade: 2% (₹{PORTFOLIO_CAPITAL * 0.02:,.0f})")
-print(f"📊 Max Position Size: 10% (₹{PORTFOLIO_CAPITAL * 0.10:,.0f})")
-
-# Initialize and run strategy
-strategy = IndianStockStrategy(portfolio_capital=PORTFOLIO_CAPITAL, index=INDEX)
-
-print("=" * 60)
-print("Starting stock screening...")
-print("=" * 60 + "\n")
-
-qualified_stocks = strategy.screen_all_stocks()
-
-# Display results
-print("\n" + "=" * 60)
-print("          SCREENING RESULTS")
-print("=" * 60)
-print(f"\n✓ Found {len(qualified_stocks)} qualifying stocks\n")
-
-if qualified_stocks:
-    for i, stock in enumerate(qualified_stocks, 1):
-        print(f"\n{i}. {stock['symbol']}")
-        print(f"   Entry Price: ₹{stock['entry_price']:.2f}")
-        print(f"   Stop Loss: ₹{stock['stop_loss']:.2f}")
-        print(f"   Target: ₹{stock['target_price']:.2f}")
-        print(f"   Quantity: {stock['quantity']}")
-        print(f"   Risk:Reward = 1:{stock['risk_reward_ratio']:.2f}")
-else:
-    print("No stocks meet all criteria at this time.")
\ No newline at end of file
+if __name__ == "__main__":
+    # Initialize strategy
+    print("=" * 60)
+    print("          INDIAN STOCK SCREENING STRATEGY")
+    print("=" * 60)
+    print(f"\n💰 Portfolio Capital: ₹{PORTFOLIO_CAPITAL:,}")
+    print(f"⚠️  Max Risk per Trade: 2% (₹{PORTFOLIO_CAPITAL * 0.02:,.0f})")
+    print(f"📊 Max Position Size: 10% (₹{PORTFOLIO_CAPITAL * 0.10:,.0f})")
+
+    # Initialize and run strategy
+    strategy = IndianStockStrategy(portfolio_capital=PORTFOLIO_CAPITAL, index=INDEX)
+
+    print("=" * 60)
+    print("Starting stock screening...")
+    print("=" * 60 + "\n")
+
+    qualified_stocks = strategy.screen_all_stocks()
+
+    # Display results
+    print("\n" + "=" * 60)
+    print("          SCREENING RESULTS")
+    print("=" * 60)
+    print(f"\n✓ Found {len(qualified_stocks)} qualifying stocks\n")
+
+    if len(qualified_stocks) > 0:
+        report = qualified_stocks[['symbol', 'entry_price', 'stop_loss', 'target_price',
+                                   'quantity', 'risk_reward_ratio']]
+        report.columns = ['Symbol', 'Entry Price', 'Stop Loss', 'Target', 'Quantity', 'Risk:Reward']
+        report.index = range(1, len(report) + 1)
+        print(report.to_string(
+            float_format=lambda x: f"{x:.2f}",
+            formatters={'Risk:Reward': lambda x: f"1:{x:.2f}"}
+        ))
+    else:
+        print("No stocks meet all criteria at this time.")